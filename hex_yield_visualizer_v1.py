@@ -2,7 +2,9 @@ import pygame
 import sys
 import webbrowser
 import json
+import math
 import os
+import random
 
 
 def resource_path(relative_path):
@@ -43,6 +45,12 @@ fallen_count = 0
 settings_open = False  # Track if settings menu is open
 sound_enabled = True  # Track if sound is enabled
 volume = 0.15  # Volume level (0.0 to 1.0)
+motion_blur = False  # Draw falling coins with a motion blur trail
+
+# Coin animation settings
+COIN_ANIMATION_FRAMES = 48  # Frames in one full spin of a coin
+COIN_TUMBLES_PER_SPIN = 2  # Times a coin flips over during one spin
+MOTION_BLUR_GHOSTS = 3  # Trailing copies drawn behind a blurred coin
 
 # Coin spawn point (fixed position at top center)
 COIN_SPAWN_X = WIDTH // 2
@@ -53,20 +61,92 @@ PIGGY_BANK_X = WIDTH // 2
 PIGGY_BANK_Y = HEIGHT - 100
 
 
+class CoinAnimation:
+    """Pre-rendered spin and tumble frames for a coin image.
+
+    Every frame is rotated and scaled once up front, so drawing an animated
+    coin costs a single blit of only its visible pixels.
+    """
+
+    def __init__(self, image, frame_count, blur):
+        self.frames = []
+        self.offsets = []  # Offset from the coin center to each frame's top-left corner
+
+        spin_frames = [self._render_frame(image, i, frame_count) for i in range(frame_count)]
+
+        for i, frame in enumerate(spin_frames):
+            if blur:
+                frame = self._blur_frame(spin_frames, i)
+            # The coin sits at the bottom of the frame, below any motion blur trail
+            half_size = frame.get_width() // 2
+            center_x, center_y = half_size, frame.get_height() - half_size
+
+            # Crop away the transparent padding so each blit only covers visible pixels
+            bounds = frame.get_bounding_rect()
+            self.frames.append(frame.subsurface(bounds).copy().convert_alpha())
+            self.offsets.append((center_x - bounds.x, center_y - bounds.y))
+
+    @staticmethod
+    def _render_frame(image, index, frame_count):
+        """Render a single tumbled and rotated frame of the coin"""
+        turn = index / frame_count
+        # Squash the coin horizontally to make it look like it is flipping over
+        tumble = abs(math.cos(turn * COIN_TUMBLES_PER_SPIN * 2 * math.pi))
+        width = max(1, int(image.get_width() * tumble))
+        squashed = pygame.transform.smoothscale(image, (width, image.get_height()))
+        rotated = pygame.transform.rotozoom(squashed, turn * 360, 1)
+
+        # Pad every frame to the same square size so the coin doesn't wobble
+        size = int(math.hypot(image.get_width(), image.get_height())) + 1
+        frame = pygame.Surface((size, size), pygame.SRCALPHA)
+        frame.blit(rotated, rotated.get_rect(center=(size // 2, size // 2)))
+        return frame
+
+    @staticmethod
+    def _blur_frame(spin_frames, index):
+        """Stack fading copies of earlier frames above a frame as a motion trail"""
+        frame = spin_frames[index]
+        size = frame.get_width()
+        trail = MOTION_BLUR_GHOSTS * fall_speed
+        blurred = pygame.Surface((size, size + trail), pygame.SRCALPHA)
+
+        # Draw the oldest ghost first so newer frames end up on top
+        for ghost in range(MOTION_BLUR_GHOSTS, 0, -1):
+            ghost_frame = spin_frames[index - ghost].copy()
+            alpha = 160 * (MOTION_BLUR_GHOSTS + 1 - ghost) // (MOTION_BLUR_GHOSTS + 1)
+            ghost_frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            blurred.blit(ghost_frame, (0, trail - ghost * fall_speed))
+
+        blurred.blit(frame, (0, trail))
+        return blurred
+
+
+# Cache of coin animations, keyed by coin size and motion blur
+coin_animations = {}
+
+
+def get_coin_animation(image, blur):
+    """Get the coin animation for an image size, rendering it on first use"""
+    key = (image.get_size(), blur)
+    if key not in coin_animations:
+        coin_animations[key] = CoinAnimation(image, COIN_ANIMATION_FRAMES, blur)
+    return coin_animations[key]
+
+
 class Coin:
-    def __init__(self, x, y, image):
+    def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.image = image
-        self.width = image.get_width()
-        self.height = image.get_height()
+        # Start at a random point in the spin so coins don't turn in lockstep
+        self.phase = random.randrange(COIN_ANIMATION_FRAMES)
 
     def update(self):
         self.y += fall_speed
+        self.phase = (self.phase + 1) % COIN_ANIMATION_FRAMES
 
-    def draw(self, surface):
-        rect = self.image.get_rect(center=(self.x, self.y))
-        surface.blit(self.image, rect)
+    def draw(self, surface, animation):
+        offset_x, offset_y = animation.offsets[self.phase]
+        surface.blit(animation.frames[self.phase], (self.x - offset_x, self.y - offset_y))
 
     def is_in_piggy_bank(self):
         # Check if coin has reached the piggy bank
@@ -198,27 +278,26 @@ class InputBox:
 
 
 class Checkbox:
-    def __init__(self, x, y, size, label):
+    def __init__(self, x, y, size, label, setting):
         self.rect = pygame.Rect(x, y, size, size)
         self.label = label
-        self.checked = sound_enabled
+        self.setting = setting  # Name of the global setting this checkbox toggles
+        self.checked = globals()[setting]
         self.font = pygame.font.Font(resource_path("arial.ttf"), 26)
         self.size = size
 
     def handle_event(self, event):
-        global sound_enabled
-
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.checked = not self.checked
-                sound_enabled = self.checked
+                globals()[self.setting] = self.checked
                 save_settings()
                 return True
         return False
 
     def update_state(self):
-        """Update checkbox to match current sound_enabled state"""
-        self.checked = sound_enabled
+        """Update checkbox to match current setting state"""
+        self.checked = globals()[self.setting]
 
     def draw(self, surface):
         # Draw checkbox box
@@ -368,7 +447,10 @@ class SettingsMenu:
         self.input_box = InputBox(self.x + 50, self.y + 115, 150, 40, "HEX yield per day:")
 
         # Create sound checkbox
-        self.sound_checkbox = Checkbox(self.x + 50, self.y + 180, 30, "Enable Sound")
+        self.sound_checkbox = Checkbox(self.x + 50, self.y + 180, 30, "Enable Sound", "sound_enabled")
+
+        # Create motion blur checkbox
+        self.motion_blur_checkbox = Checkbox(self.x + 270, self.y + 180, 30, "Motion Blur", "motion_blur")
 
         # Create volume slider
         self.volume_slider = Slider(self.x + 50, self.y + 250, 200, 20, 0.0, 1.0, volume, "Volume")
@@ -395,7 +477,7 @@ class SettingsMenu:
                 return
 
         # Pass event to controls
-        if not self.sound_checkbox.handle_event(event):
+        if not self.sound_checkbox.handle_event(event) and not self.motion_blur_checkbox.handle_event(event):
             if not self.volume_slider.handle_event(event):
                 if not self.music_link.handle_event(event):
                     self.input_box.handle_event(event)
@@ -424,6 +506,10 @@ class SettingsMenu:
         self.sound_checkbox.update_state()
         self.sound_checkbox.draw(surface)
 
+        # Draw motion blur checkbox
+        self.motion_blur_checkbox.update_state()
+        self.motion_blur_checkbox.draw(surface)
+
         # Draw volume slider
         self.volume_slider.draw(surface)
 
@@ -456,6 +542,9 @@ class SettingsMenu:
         self.sound_checkbox.rect.x = self.x + 50
         self.sound_checkbox.rect.y = self.y + 170
 
+        self.motion_blur_checkbox.rect.x = self.x + 270
+        self.motion_blur_checkbox.rect.y = self.y + 170
+
         self.volume_slider.rect.x = self.x + 50
         self.volume_slider.rect.y = self.y + 240
 
@@ -470,7 +559,8 @@ def save_settings():
     settings = {
         'coins_per_day': coins_per_day,
         'sound_enabled': sound_enabled,
-        'volume': volume
+        'volume': volume,
+        'motion_blur': motion_blur
     }
     try:
         with open('hex_visualizer_settings.json', 'w') as f:
@@ -481,7 +571,7 @@ def save_settings():
 
 def load_settings():
     """Load settings from JSON file"""
-    global coins_per_day, sound_enabled, volume
+    global coins_per_day, sound_enabled, volume, motion_blur
 
     if os.path.exists('hex_visualizer_settings.json'):
         try:
@@ -490,6 +580,7 @@ def load_settings():
                 coins_per_day = settings.get('coins_per_day', 25000)
                 sound_enabled = settings.get('sound_enabled', True)
                 volume = settings.get('volume', 0.15)
+                motion_blur = settings.get('motion_blur', False)
                 print("Settings loaded successfully")
         except Exception as e:
             print(f"Error loading settings: {e}")
@@ -497,6 +588,7 @@ def load_settings():
             coins_per_day = 25000
             sound_enabled = True
             volume = 0.15
+            motion_blur = False
     else:
         print("No saved settings found, using defaults")
 
@@ -609,7 +701,7 @@ while running:
 
     # Spawn new coins based on actual time elapsed
     if current_time - last_spawn_time >= spawn_interval:
-        new_coin = Coin(COIN_SPAWN_X, COIN_SPAWN_Y, coin_image)
+        new_coin = Coin(COIN_SPAWN_X, COIN_SPAWN_Y)
         coins.append(new_coin)
         last_spawn_time = current_time
 
@@ -643,8 +735,9 @@ while running:
     screen.blit(coin_image, coin_rect)
 
     # Draw coins
+    coin_animation = get_coin_animation(coin_image, motion_blur)
     for coin in coins:
-        coin.draw(screen)
+        coin.draw(screen, coin_animation)
 
     # Draw counter
     font = pygame.font.Font(resource_path("impact.ttf"), 36)